@@ -5,19 +5,26 @@ CFP Rankings Scraper v2 - Properly handles the dropdown selectors
 This version correctly uses the year and week dropdown selectors found on the CFP website.
 """
 
-import time
+import asyncio
 import json
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 import logging
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException
+import lxml.html
 
 # Configure logging
 logging.basicConfig(
@@ -30,17 +37,266 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Exports (and main()'s checkpoint) are written here
+EXPORT_DIR = "/Users/mainamusa/Documents/Personal/CFB Data/cfp-ranking-predictor"
+
+# Rank cells look like "1", "#1" or "1."; records like "12-1"
+RANK_PATTERN = re.compile(r'^#?\s*(\d{1,2})\.?$')
+RECORD_PATTERN = re.compile(r'^\d{1,2}-\d{1,2}$')
+
+# Subresources the browser never needs to fetch to render the rankings tables.
+# Patterns match the whole URL, so the trailing * covers cache-busting query strings
+BLOCKED_RESOURCES = [
+    '*.css*', '*.woff*', '*.ttf*', '*.otf*',
+    '*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*'
+]
+
+# Rankings are collected as plain tuples in this column order
+RANKING_COLUMNS = ['year', 'week', 'rank', 'team', 'record', 'scraped_at']
+Ranking = Tuple[int, str, int, str, str, str]
+
+# Dropdowns are read and changed in one WebDriver call each rather than
+# one round-trip per <option>
+OPTION_TEXTS_SCRIPT = """
+return Array.from(arguments[0].options, function (option) {
+    return option.text.trim();
+}).filter(Boolean);
+"""
+SELECT_OPTION_SCRIPT = """
+var select = arguments[0], text = arguments[1];
+for (var i = 0; i < select.options.length; i++) {
+    if (select.options[i].text.trim() === text) {
+        if (select.selectedIndex === i) {
+            return 'unchanged';
+        }
+        select.selectedIndex = i;
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+        return 'changed';
+    }
+}
+return 'missing';
+"""
+
+# Only the rankings tables are serialized over the WebDriver wire, not the whole DOM
+TABLES_HTML_SCRIPT = """
+return Array.from(document.querySelectorAll('table'), function (table) {
+    return table.outerHTML;
+}).join('');
+"""
+
+# Playwright equivalents of the WebDriver scripts above, plus the stale-table marker
+PW_OPTION_TEXTS_SCRIPT = "select => Array.from(select.options, option => option.text.trim()).filter(Boolean)"
+PW_SELECTED_TEXT_SCRIPT = "select => select.selectedIndex < 0 ? '' : select.options[select.selectedIndex].text.trim()"
+PW_TABLES_HTML_SCRIPT = "() => Array.from(document.querySelectorAll('table'), table => table.outerHTML).join('')"
+PW_MARK_TABLES_SCRIPT = """() => {
+    const tables = document.querySelectorAll('table');
+    tables.forEach(table => table.setAttribute('data-cfp-stale', ''));
+    return tables.length > 0;
+}"""
+PW_BLOCKED_RESOURCE_TYPES = {'image', 'stylesheet', 'font', 'media'}
+
+
+class _ScraperState(threading.local):
+    """Per-thread driver, HTTP session and postback form state."""
+    
+    def __init__(self, base_url: str):
+        self.driver = None
+        self.session = None
+        self.form_action = base_url
+        self.form_fields: Dict[str, str] = {}
+        self.form_selects: List[Tuple[str, Dict[str, str], str]] = []
+
 
 class CFPRankingsScraper:
     """CFP Rankings Scraper that properly uses dropdown selectors."""
     
-    def __init__(self, headless: bool = True, wait_time: int = 10):
-        """Initialize the scraper."""
+    def __init__(self, headless: bool = True, wait_time: int = 10, max_workers: int = 4,
+                 checkpoint_file: Optional[str] = None):
+        """Initialize the scraper.
+        
+        If checkpoint_file is set, completed weeks are appended to it so an
+        interrupted scrape resumes where it stopped.
+        """
         self.base_url = "https://collegefootballplayoff.com/rankings.aspx"
         self.wait_time = wait_time
         self.headless = headless
+        self.max_workers = max_workers
+        self.checkpoint_file = checkpoint_file
+        # None until the HTTP postback path has been probed
+        self._http_ready: Optional[bool] = None
+        # Each worker thread gets its own driver/session; track them all for cleanup
+        self._state = _ScraperState(self.base_url)
+        self._lock = threading.Lock()
+        self._drivers: List[webdriver.Chrome] = []
+        self._sessions: List[requests.Session] = []
+        # Inside a with-block, worker threads (and so their drivers) live until
+        # __exit__ instead of per scrape
+        self._managed = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+    def __enter__(self) -> 'CFPRankingsScraper':
+        self._managed = True
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._managed = False
+        self.close()
+
+    @property
+    def driver(self) -> Optional[webdriver.Chrome]:
+        """Chrome WebDriver for the current thread."""
+        return self._state.driver
+
+    @driver.setter
+    def driver(self, driver: Optional[webdriver.Chrome]):
+        self._state.driver = driver
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """HTTP session for the current thread."""
+        return self._state.session
+
+    @session.setter
+    def session(self, session: Optional[requests.Session]):
+        self._state.session = session
+
+    def close(self):
+        """Quit every driver and close every session created by any thread."""
+        executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
+        
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+            sessions, self._sessions = self._sessions, []
         self.driver = None
+        self.session = None
+        
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Error quitting ChromeDriver: {e}")
+        for session in sessions:
+            session.close()
+
+    def _quit_driver(self):
+        """Quit the current thread's driver, if it has one."""
+        driver = self.driver
+        if driver is None:
+            return
+        
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        self.driver = None
+        
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting ChromeDriver: {e}")
+
+    def _setup_session(self) -> requests.Session:
+        """Set up a keep-alive HTTP session for ASP.NET postbacks."""
+        logger.info("Setting up HTTP session...")
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; cfp-rankings-scraper)'
+        })
+        with self._lock:
+            self._sessions.append(session)
+        return session
+
+    def _load_form_state(self, page: lxml.html.HtmlElement, url: str) -> bool:
+        """Harvest the ASP.NET form state and dropdowns from a parsed page.
+        
+        Returns True if the page can be driven with plain HTTP postbacks.
+        """
+        forms = page.xpath('//form')
+        if forms and forms[0].get('action'):
+            self._state.form_action = urljoin(url, forms[0].get('action'))
+        
+        # __VIEWSTATE, __EVENTVALIDATION, etc.
+        self._state.form_fields = {
+            field.get('name'): field.get('value', '')
+            for field in page.xpath('//input[@type="hidden"][@name]')
+        }
+        
+        # (name, {visible text: value}, selected value) for each dropdown
+        self._state.form_selects = []
+        for select in page.xpath('//select[@name]'):
+            options = {}
+            selected = None
+            for option in select.xpath('.//option'):
+                text = self._cell_text(option)
+                if not text:
+                    continue
+                value = option.get('value', text)
+                options[text] = value
+                if selected is None or option.get('selected') is not None:
+                    selected = value
+            self._state.form_selects.append((select.get('name'), options, selected or ''))
+        
+        return '__VIEWSTATE' in self._state.form_fields and len(self._state.form_selects) >= 2
+
+    def _open_session(self) -> bool:
+        """Load the rankings page over HTTP and harvest its form state."""
+        try:
+            if not self.session:
+                self.session = self._setup_session()
+            
+            response = self.session.get(self.base_url, timeout=self.wait_time)
+            response.raise_for_status()
+            
+            if self._load_form_state(lxml.html.fromstring(response.content), response.url):
+                return True
+            
+            logger.warning("Rankings page has no postback form, falling back to browser")
+            return False
+        except Exception as e:
+            logger.warning(f"HTTP session unavailable, falling back to browser: {e}")
+            return False
+
+    def _postback(self, select_index: int, text: str) -> Optional[lxml.html.HtmlElement]:
+        """Post a dropdown change back to the server and return the new page, parsed."""
+        name, options, _ = self._state.form_selects[select_index]
+        
+        if text not in options:
+            logger.error(f"Option {text} not found in {name}")
+            return None
+        
+        data = dict(self._state.form_fields)
+        for select_name, _, selected in self._state.form_selects:
+            data[select_name] = selected
+        data[name] = options[text]
+        data['__EVENTTARGET'] = name
+        data['__EVENTARGUMENT'] = ''
+        
+        response = self.session.post(self._state.form_action, data=data, timeout=self.wait_time)
+        response.raise_for_status()
+        
+        # Each postback returns a fresh __VIEWSTATE for the next one; the same
+        # tree is handed on to _parse_rankings so the page is only parsed once
+        page = lxml.html.fromstring(response.content)
+        self._load_form_state(page, response.url)
+        
+        # A page whose dropdowns really work through JS or a query string just
+        # returns its default selection; never label that page with our selection
+        selects = self._state.form_selects
+        if len(selects) <= select_index or selects[select_index][2] != options[text]:
+            logger.warning(f"Server ignored the {text} postback, falling back to browser")
+            self._http_ready = False
+            return None
         
+        return page
+
+    def _form_options(self, select_index: int) -> List[str]:
+        """Get the visible option texts of a dropdown from the form state."""
+        if len(self._state.form_selects) > select_index:
+            return list(self._state.form_selects[select_index][1])
+        return []
+
     def _setup_driver(self) -> webdriver.Chrome:
         """Set up Chrome WebDriver."""
         logger.info("Setting up Chrome WebDriver...")
@@ -52,24 +308,55 @@ class CFPRankingsScraper:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
+        # Return from driver.get() at DOMContentLoaded; the tables are in the initial
+        # HTML and explicit waits cover the rest, so don't block on ads and trackers
+        chrome_options.page_load_strategy = 'eager'
+        # Only the table HTML is needed; skip logos, stylesheets and fonts
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-features=TranslateUI")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2
+        })
         
         try:
             driver = webdriver.Chrome(options=chrome_options)
+            with self._lock:
+                self._drivers.append(driver)
+            
+            # Content-settings prefs don't cover every subresource, so block them outright too
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCES})
             logger.info("ChromeDriver initialized successfully")
             return driver
         except Exception as e:
             logger.error(f"Failed to initialize ChromeDriver: {e}")
             raise
 
-    def _get_available_years(self) -> List[str]:
+    def _wait_for_dropdowns(self) -> list:
+        """Wait until the year and week dropdowns have rendered and return them."""
+        def find_dropdowns(driver):
+            selects = driver.find_elements(By.TAG_NAME, "select")
+            return selects if len(selects) >= 2 else False
+        
+        return WebDriverWait(self.driver, self.wait_time).until(find_dropdowns)
+
+    def _get_available_years(self, select_elements: Optional[list] = None) -> List[str]:
         """Get available years from the dropdown."""
         try:
-            select_elements = self.driver.find_elements(By.TAG_NAME, "select")
+            if self._http_ready:
+                years = self._form_options(0)
+                logger.info(f"Found years: {years}")
+                return years
+            
+            # Reuse the dropdowns _wait_for_dropdowns just found, if given
+            if select_elements is None:
+                select_elements = self.driver.find_elements(By.TAG_NAME, "select")
             
             if len(select_elements) >= 1:
                 # First select should be years
-                year_select = Select(select_elements[0])
-                years = [option.text.strip() for option in year_select.options if option.text.strip()]
+                years = self.driver.execute_script(OPTION_TEXTS_SCRIPT, select_elements[0])
                 logger.info(f"Found years: {years}")
                 return years
             else:
@@ -79,15 +366,20 @@ class CFPRankingsScraper:
             logger.error(f"Error getting available years: {e}")
             return []
 
-    def _get_available_weeks(self) -> List[str]:
+    def _get_available_weeks(self, select_elements: Optional[list] = None) -> List[str]:
         """Get available weeks from the dropdown."""
         try:
-            select_elements = self.driver.find_elements(By.TAG_NAME, "select")
+            if self._http_ready:
+                weeks = self._form_options(1)
+                logger.info(f"Found weeks: {weeks}")
+                return weeks
+            
+            if select_elements is None:
+                select_elements = self.driver.find_elements(By.TAG_NAME, "select")
             
             if len(select_elements) >= 2:
                 # Second select should be weeks
-                week_select = Select(select_elements[1])
-                weeks = [option.text.strip() for option in week_select.options if option.text.strip()]
+                weeks = self.driver.execute_script(OPTION_TEXTS_SCRIPT, select_elements[1])
                 logger.info(f"Found weeks: {weeks}")
                 return weeks
             else:
@@ -97,6 +389,41 @@ class CFPRankingsScraper:
             logger.error(f"Error getting available weeks: {e}")
             return []
 
+    def _current_table(self):
+        """Get a handle to the rankings table currently rendered, if any."""
+        tables = self.driver.find_elements(By.CSS_SELECTOR, "table")
+        return tables[0] if tables else None
+
+    def _wait_for_rankings(self, old_table=None):
+        """Wait until a dropdown change has re-rendered the rankings table.
+        
+        Raises TimeoutException if the old table is never replaced, so the
+        previous selection's rankings aren't read under the new label.
+        """
+        wait = WebDriverWait(self.driver, self.wait_time)
+        
+        if old_table is not None:
+            wait.until(EC.staleness_of(old_table))
+        
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tr")))
+
+    def _select_option(self, select_element, text: str) -> bool:
+        """Select a dropdown option by visible text and wait for the page to update.
+        
+        Returns False if the option was already selected, since re-selecting
+        it fires no update.
+        """
+        old_table = self._current_table()
+        status = self.driver.execute_script(SELECT_OPTION_SCRIPT, select_element, text)
+        
+        if status == 'missing':
+            raise NoSuchElementException(f"Could not locate option with visible text: {text}")
+        if status == 'unchanged':
+            return False
+        
+        self._wait_for_rankings(old_table)
+        return True
+
     def _select_year_and_week(self, year: str, week: str) -> bool:
         """Select specific year and week from dropdowns."""
         try:
@@ -106,14 +433,12 @@ class CFPRankingsScraper:
             
             if len(select_elements) >= 2:
                 # Select year (first dropdown)
-                year_select = Select(select_elements[0])
-                year_select.select_by_visible_text(year)
-                time.sleep(2)
+                if self._select_option(select_elements[0], year):
+                    # The year postback re-rendered the page, so the week handle is stale
+                    select_elements = self.driver.find_elements(By.TAG_NAME, "select")
                 
                 # Select week (second dropdown)
-                week_select = Select(select_elements[1])
-                week_select.select_by_visible_text(week)
-                time.sleep(3)  # Wait for page to update
+                self._select_option(select_elements[1], week)
                 
                 logger.info(f"Successfully selected {year}, {week}")
                 return True
@@ -125,95 +450,90 @@ class CFPRankingsScraper:
             logger.error(f"Error selecting {year}, {week}: {e}")
             return False
 
-    def _extract_rankings_from_current_page(self, year: str, week: str) -> List[Dict]:
-        """Extract rankings from the currently loaded page."""
+    def _select_year_http(self, year: str) -> List[str]:
+        """Select a year via HTTP postback and return its available weeks."""
+        logger.info(f"Selecting year: {year}")
+        
+        # Start from a fresh page so the year postback has a clean __VIEWSTATE
+        if not self._open_session():
+            self._http_ready = False
+            return []
+        
+        if self._postback(0, year) is None:
+            return []
+        
+        return self._get_available_weeks()
+
+    def _extract_rankings_from_current_page(self, year: str, week: str) -> List[Ranking]:
+        """Extract rankings from the page currently loaded in the browser."""
+        tables_html = self.driver.execute_script(TABLES_HTML_SCRIPT)
+        return self._parse_rankings(tables_html, year, week)
+
+    @staticmethod
+    def _cell_text(cell) -> str:
+        """Get a cell's text the way BeautifulSoup's get_text(strip=True) does."""
+        return ''.join(text.strip() for text in cell.itertext())
+
+    def _parse_rankings(self, page_source: Union[str, bytes, lxml.html.HtmlElement],
+                        year: str, week: str) -> List[Ranking]:
+        """Extract rankings from a rankings page's HTML or its parsed tree."""
         logger.info(f"Extracting rankings for {year}, {week}...")
         
         rankings_data = []
         
         try:
-            # Wait a bit for content to load
-            time.sleep(3)
-            
-            # Get page source and parse with BeautifulSoup
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            # Walk table rows with lxml directly; this is the hot path for every week
+            if isinstance(page_source, (str, bytes)):
+                page_source = lxml.html.fromstring(page_source) if page_source else None
+            rows = page_source.xpath('//table//tr') if page_source is not None else []
             
-            # Look for ranking tables
-            tables = soup.find_all('table')
+            # One timestamp per page; every row on it was scraped together
+            scraped_at = datetime.now().isoformat()
+            year_number = int(year)
             
-            for table in tables:
-                rows = table.find_all('tr')
+            for row in rows:
+                cells = row.xpath('./td|./th')
                 
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
+                if len(cells) >= 3:
+                    texts = [self._cell_text(cell) for cell in cells]
                     
-                    if len(cells) >= 3:
-                        # Try to extract rank from first cell
-                        rank_text = cells[0].get_text(strip=True)
-                        
-                        # Skip header rows
-                        if rank_text.lower() in ['rank', '#', 'ranking', 'rnk']:
-                            continue
-                            
-                        try:
-                            # Clean rank text and convert to int
-                            rank_clean = rank_text.replace('#', '').replace('.', '').strip()
-                            rank = int(rank_clean)
-                            
-                            # Validate rank range
-                            if not (1 <= rank <= 25):
-                                continue
-                                
-                        except (ValueError, TypeError):
-                            continue
-                        
-                        # Extract team name (usually in 2nd or 3rd cell)
-                        team_name = ""
-                        for i in range(1, min(4, len(cells))):
-                            cell_text = cells[i].get_text(strip=True)
-                            # Clean up team name
-                            cell_text = cell_text.replace('Logo', '').replace('logo', '').strip()
-                            
-                            # Skip cells with just numbers or short text
-                            if cell_text and len(cell_text) > 2 and not cell_text.isdigit():
-                                team_name = cell_text
-                                break
-                        
-                        # Extract record (look for pattern like "12-1", "10-2")
-                        record = ""
-                        for cell in cells[1:6]:  # Check multiple cells for record
-                            cell_text = cell.get_text(strip=True)
-                            # Look for record pattern (numbers-numbers)
-                            if '-' in cell_text and len(cell_text) <= 8:
-                                # Validate it looks like a record
-                                parts = cell_text.split('-')
-                                if len(parts) == 2 and all(part.isdigit() for part in parts):
-                                    record = cell_text
-                                    break
+                    # Header rows and other non-rank cells don't match
+                    rank_match = RANK_PATTERN.match(texts[0])
+                    if not rank_match:
+                        continue
+                    
+                    # Validate rank range
+                    rank = int(rank_match.group(1))
+                    if not (1 <= rank <= 25):
+                        continue
+                    
+                    # Extract team name (usually in 2nd or 3rd cell)
+                    team_name = ""
+                    for cell_text in texts[1:4]:
+                        # Clean up team name
+                        cell_text = cell_text.replace('Logo', '').replace('logo', '').strip()
                         
-                        # Only add if we have valid data
-                        if team_name and 1 <= rank <= 25:
-                            ranking_entry = {
-                                'year': int(year),
-                                'week': week,
-                                'rank': rank,
-                                'team': team_name,
-                                'record': record,
-                                'scraped_at': datetime.now().isoformat()
-                            }
-                            rankings_data.append(ranking_entry)
-                            logger.debug(f"Added: #{rank} {team_name} ({record})")
-            
-            # If no data found in tables, try alternative methods
+                        # Skip cells with just numbers or short text
+                        if cell_text and len(cell_text) > 2 and not cell_text.isdigit():
+                            # The same few dozen teams recur every week; share one string each
+                            team_name = sys.intern(cell_text)
+                            break
+                    
+                    # Extract record (look for pattern like "12-1", "10-2")
+                    record = ""
+                    for cell_text in texts[1:6]:  # Check multiple cells for record
+                        # Look for record pattern (numbers-numbers)
+                        if RECORD_PATTERN.match(cell_text):
+                            record = cell_text
+                            break
+                    
+                    # Only add if we have valid data
+                    if team_name and 1 <= rank <= 25:
+                        rankings_data.append((year_number, week, rank, team_name, record, scraped_at))
+                        logger.debug(f"Added: #{rank} {team_name} ({record})")
+            
             if not rankings_data:
                 logger.warning(f"No rankings found in tables for {year}, {week}")
-                
-                # Try to find rankings in other formats (divs, lists, etc.)
-                ranking_divs = soup.find_all('div', class_=lambda x: x and ('rank' in x.lower() or 'team' in x.lower()))
-                
-                # This would need more specific parsing based on actual site structure
-                # For now, we'll rely on table parsing
             
             logger.info(f"Extracted {len(rankings_data)} rankings for {year}, {week}")
             
@@ -222,37 +542,124 @@ class CFPRankingsScraper:
         
         return rankings_data
 
-    def scrape_year(self, year: str) -> List[Dict]:
-        """Scrape all available weeks for a specific year."""
+    def _load_checkpoint(self) -> Dict[Tuple[str, str], List[Ranking]]:
+        """Load the rankings of every year/week completed by an earlier run."""
+        completed = {}
+        
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            return completed
+        
+        with open(self.checkpoint_file) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated last line
+                    continue
+                completed[(str(entry['year']), entry['week'])] = [tuple(row) for row in entry['rows']]
+        
+        logger.info(f"Loaded {len(completed)} completed weeks from {self.checkpoint_file}")
+        return completed
+
+    def _save_checkpoint(self, year: str, week: str, rows: List[Ranking]):
+        """Append a completed year/week and its rankings to the checkpoint.
+        
+        A failed write is logged rather than raised, so the scraped week
+        is still returned.
+        """
+        if not self.checkpoint_file:
+            return
+        
+        line = json.dumps({'year': int(year), 'week': week, 'rows': rows}).encode()
+        try:
+            with self._lock:
+                with open(self.checkpoint_file, 'ab+') as f:
+                    # Don't append onto a line truncated by a crash mid-write
+                    if f.seek(0, os.SEEK_END):
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            line = b'\n' + line
+                    f.write(line + b'\n')
+                    f.flush()
+        except OSError as e:
+            logger.warning(f"Could not checkpoint {year}, {week}: {e}")
+
+    def scrape_year(self, year: str,
+                    completed: Optional[Dict[Tuple[str, str], List[Ranking]]] = None) -> List[Ranking]:
+        """Scrape all available weeks for a specific year.
+        
+        completed is the loaded checkpoint; it is read from disk if not given.
+        """
         logger.info(f"Scraping year {year}...")
         
+        if completed is None:
+            completed = self._load_checkpoint()
+        
+        if self._http_ready is None:
+            self._http_ready = self._open_session()
+        
+        used_http = self._http_ready
+        year_data = self._scrape_weeks(year, completed)
+        
+        if used_http and not self._http_ready:
+            # The page stopped loading or the server ignored a postback, so nothing
+            # from the HTTP pass can be trusted
+            logger.warning(f"Re-scraping year {year} in the browser")
+            year_data = self._scrape_weeks(year, completed)
+        
+        return year_data
+
+    def _scrape_weeks(self, year: str, completed: Dict[Tuple[str, str], List[Ranking]]) -> List[Ranking]:
+        """Scrape every week of a year over HTTP postbacks or in the browser."""
         year_data = []
         
-        if not self.driver:
+        # Another thread may switch the scraper to the browser mid-year
+        use_http = self._http_ready
+        
+        if not use_http and not self.driver:
             self.driver = self._setup_driver()
         
         try:
-            # Navigate to main rankings page
-            self.driver.get(self.base_url)
-            time.sleep(5)
-            
-            # Get available weeks for this year
-            weeks = self._get_available_weeks()
+            if use_http:
+                # Get available weeks for this year from the postback response
+                weeks = self._select_year_http(year)
+            else:
+                # Navigate to main rankings page
+                self.driver.get(self.base_url)
+                select_elements = self._wait_for_dropdowns()
+                
+                # Get available weeks for this year
+                weeks = self._get_available_weeks(select_elements)
             
             for week in weeks:
+                # Weeks finished by an interrupted run don't need scraping again
+                if (year, week) in completed:
+                    year_data.extend(completed[(year, week)])
+                    logger.info(f"Year {year}, {week}: restored from checkpoint")
+                    continue
+                
                 try:
-                    # Select year and week
-                    if self._select_year_and_week(year, week):
+                    if use_http:
+                        # Select week and parse the returned page directly
+                        page = self._postback(1, week)
+                        if page is None:
+                            if not self._http_ready:
+                                break
+                            logger.warning(f"Failed to select {year}, {week}")
+                            continue
+                        week_rankings = self._parse_rankings(page, year, week)
+                    elif self._select_year_and_week(year, week):
                         # Extract rankings
                         week_rankings = self._extract_rankings_from_current_page(year, week)
-                        year_data.extend(week_rankings)
-                        
-                        logger.info(f"Year {year}, {week}: {len(week_rankings)} rankings")
-                        
-                        # Small delay between weeks
-                        time.sleep(2)
                     else:
                         logger.warning(f"Failed to select {year}, {week}")
+                        continue
+                    
+                    if week_rankings:
+                        self._save_checkpoint(year, week, week_rankings)
+                    
+                    year_data.extend(week_rankings)
+                    logger.info(f"Year {year}, {week}: {len(week_rankings)} rankings")
                         
                 except Exception as e:
                     logger.error(f"Error scraping {year}, {week}: {e}")
@@ -263,7 +670,19 @@ class CFPRankingsScraper:
         
         return year_data
 
-    def scrape_all_years(self, start_year: int = 2014, end_year: int = None) -> List[Dict]:
+    def _scrape_year_worker(self, year: str,
+                            completed: Dict[Tuple[str, str], List[Ranking]]) -> List[Ranking]:
+        """Scrape one year on a worker thread, using that thread's own driver/session."""
+        try:
+            year_data = self.scrape_year(year, completed)
+            logger.info(f"Year {year} complete: {len(year_data)} rankings")
+            return year_data
+            
+        except Exception as e:
+            logger.error(f"Failed to scrape year {year}: {e}")
+            return []
+
+    def scrape_all_years(self, start_year: int = 2014, end_year: int = None) -> List[Ranking]:
         """Scrape all years of rankings data."""
         if end_year is None:
             end_year = datetime.now().year
@@ -273,13 +692,24 @@ class CFPRankingsScraper:
         all_data = []
         
         try:
-            self.driver = self._setup_driver()
+            # Prefer plain HTTP postbacks; only launch Chrome if the form can't be driven
+            self._http_ready = self._open_session()
             
-            # Get list of available years from the website
-            self.driver.get(self.base_url)
-            time.sleep(5)
+            select_elements = None
+            if not self._http_ready:
+                self.driver = self._setup_driver()
+                
+                # Get list of available years from the website
+                self.driver.get(self.base_url)
+                select_elements = self._wait_for_dropdowns()
             
-            available_years = self._get_available_years()
+            available_years = self._get_available_years(select_elements)
+            
+            # Workers start their own browsers; don't leave this one idling alongside them
+            self._quit_driver()
+            
+            # Read the checkpoint once and share it with every worker
+            completed = self._load_checkpoint()
             
             # Filter years based on requested range
             target_years = [year for year in available_years 
@@ -287,59 +717,195 @@ class CFPRankingsScraper:
             
             logger.info(f"Will scrape years: {target_years}")
             
-            for year in target_years:
-                try:
-                    year_data = self.scrape_year(year)
+            # Years are independent, so scrape them concurrently. A managed scraper
+            # reuses its pool so each worker keeps the driver it already started
+            executor = self._executor or ThreadPoolExecutor(max_workers=self.max_workers)
+            try:
+                for year_data in executor.map(self._scrape_year_worker, target_years,
+                                              [completed] * len(target_years)):
                     all_data.extend(year_data)
-                    logger.info(f"Year {year} complete: {len(year_data)} rankings")
-                    
-                    # Longer pause between years
-                    time.sleep(5)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to scrape year {year}: {e}")
-                    continue
+            finally:
+                if executor is not self._executor:
+                    executor.shutdown(wait=True)
             
         except Exception as e:
             logger.error(f"Error during scraping: {e}")
         finally:
-            if self.driver:
-                self.driver.quit()
+            if not self._managed:
+                self.close()
         
         logger.info(f"Scraping completed. Total: {len(all_data)} rankings")
         return all_data
 
-    def export_to_csv(self, data: List[Dict], filename: str = None) -> str:
+    async def _select_option_async(self, page, index: int, text: str):
+        """Select a dropdown option in a Playwright page and wait for the page to update."""
+        select = page.locator("select").nth(index)
+        timeout = self.wait_time * 1000
+        
+        # Re-selecting the current option fires no postback
+        if await select.evaluate(PW_SELECTED_TEXT_SCRIPT) == text:
+            return
+        
+        # Tag the current tables so the re-rendered ones can be told apart from them
+        had_table = await page.evaluate(PW_MARK_TABLES_SCRIPT)
+        await select.select_option(label=text)
+        
+        # Like the sync path's staleness wait: the old table must go away, whether
+        # the postback navigated or re-rendered in place, before any table is read
+        if had_table:
+            await page.locator("table[data-cfp-stale]").first.wait_for(state="detached", timeout=timeout)
+        await page.wait_for_selector("table tr", timeout=timeout)
+
+    async def _open_page_async(self, context, year: Optional[str] = None):
+        """Open a new page on the rankings site, optionally with a year selected."""
+        page = await context.new_page()
+        await page.goto(self.base_url, wait_until="domcontentloaded")
+        await page.wait_for_selector("select >> nth=1", state="attached",
+                                     timeout=self.wait_time * 1000)
+        
+        if year is not None:
+            await self._select_option_async(page, 0, year)
+        
+        return page
+
+    async def _get_weeks_async(self, context, year: str, semaphore: asyncio.Semaphore) -> List[str]:
+        """Get the available weeks for a year in its own page."""
+        async with semaphore:
+            try:
+                page = await self._open_page_async(context, year)
+                try:
+                    weeks = await page.locator("select").nth(1).evaluate(PW_OPTION_TEXTS_SCRIPT)
+                    logger.info(f"Found weeks for {year}: {weeks}")
+                    return weeks
+                finally:
+                    await page.close()
+            except Exception as e:
+                logger.error(f"Error getting available weeks for {year}: {e}")
+                return []
+
+    async def _scrape_week_async(self, context, year: str, week: str,
+                                 semaphore: asyncio.Semaphore) -> List[Ranking]:
+        """Scrape one year/week in its own page."""
+        async with semaphore:
+            try:
+                page = await self._open_page_async(context, year)
+                try:
+                    await self._select_option_async(page, 1, week)
+                    tables_html = await page.evaluate(PW_TABLES_HTML_SCRIPT)
+                    
+                    week_rankings = self._parse_rankings(tables_html, year, week)
+                    
+                    if week_rankings:
+                        self._save_checkpoint(year, week, week_rankings)
+                    
+                    logger.info(f"Year {year}, {week}: {len(week_rankings)} rankings")
+                    return week_rankings
+                finally:
+                    await page.close()
+            except Exception as e:
+                logger.error(f"Error scraping {year}, {week}: {e}")
+                return []
+
+    async def scrape_all_years_async(self, start_year: int = 2014, end_year: int = None,
+                                     max_pages: int = 8) -> List[Ranking]:
+        """Scrape all years of rankings data with Playwright.
+        
+        One Chromium instance loads up to max_pages year/week pages concurrently.
+        Requires the optional playwright package and `playwright install chromium`.
+        """
+        from playwright.async_api import async_playwright
+        
+        if end_year is None:
+            end_year = datetime.now().year
+            
+        logger.info(f"Starting Playwright scrape from {start_year} to {end_year}")
+        
+        all_data = []
+        
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=self.headless)
+            try:
+                context = await browser.new_context()
+                
+                # Only the table HTML is needed; skip logos, stylesheets and fonts
+                async def block_subresources(route):
+                    if route.request.resource_type in PW_BLOCKED_RESOURCE_TYPES:
+                        await route.abort()
+                    else:
+                        await route.continue_()
+                await context.route("**/*", block_subresources)
+                
+                # Get list of available years from the website
+                page = await self._open_page_async(context)
+                available_years = await page.locator("select").nth(0).evaluate(PW_OPTION_TEXTS_SCRIPT)
+                await page.close()
+                
+                # Filter years based on requested range
+                target_years = [year for year in available_years
+                              if start_year <= int(year) <= end_year]
+                
+                logger.info(f"Will scrape years: {target_years}")
+                
+                semaphore = asyncio.Semaphore(max_pages)
+                year_weeks = await asyncio.gather(
+                    *(self._get_weeks_async(context, year, semaphore) for year in target_years)
+                )
+                
+                # Every year/week is independent, so load them all concurrently,
+                # skipping weeks finished by an interrupted run
+                completed = self._load_checkpoint()
+                pairs = [(year, week) for year, weeks in zip(target_years, year_weeks)
+                         for week in weeks]
+                week_results = await asyncio.gather(
+                    *(self._scrape_week_async(context, year, week, semaphore)
+                      for year, week in pairs if (year, week) not in completed)
+                )
+                for year, week in pairs:
+                    all_data.extend(completed.get((year, week), []))
+                for week_rankings in week_results:
+                    all_data.extend(week_rankings)
+                
+            except Exception as e:
+                logger.error(f"Error during scraping: {e}")
+            finally:
+                await browser.close()
+        
+        logger.info(f"Scraping completed. Total: {len(all_data)} rankings")
+        return all_data
+
+    def export_to_csv(self, data: List[Ranking], filename: str = None) -> str:
         """Export data to CSV."""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"cfp_rankings_{timestamp}.csv"
         
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(data, columns=RANKING_COLUMNS)
         if not df.empty:
+            df['team'] = df['team'].astype('category')
             # Sort by year, week order, then rank
             df = df.sort_values(['year', 'week', 'rank'])
         
-        filepath = f"/Users/mainamusa/Documents/Personal/CFB Data/cfp-ranking-predictor/{filename}"
+        filepath = os.path.join(EXPORT_DIR, filename)
         df.to_csv(filepath, index=False)
         
         logger.info(f"Data exported to {filepath}")
         return filepath
 
-    def export_by_year(self, data: List[Dict]) -> List[str]:
+    def export_by_year(self, data: List[Ranking]) -> List[str]:
         """Export separate CSV files for each year."""
         files_created = []
         
         if not data:
             return files_created
         
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(data, columns=RANKING_COLUMNS)
+        df['team'] = df['team'].astype('category')
         
-        for year in df['year'].unique():
-            year_data = df[df['year'] == year]
+        # One grouping pass instead of a boolean mask scan per year
+        for year, year_data in df.groupby('year', sort=False):
             filename = f"cfp_rankings_{year}_fixed.csv"
             
-            filepath = f"/Users/mainamusa/Documents/Personal/CFB Data/cfp-ranking-predictor/{filename}"
+            filepath = os.path.join(EXPORT_DIR, filename)
             year_data.to_csv(filepath, index=False)
             
             files_created.append(filepath)
@@ -350,33 +916,33 @@ class CFPRankingsScraper:
 
 def main():
     """Main function to run the scraper."""
-    scraper = CFPRankingsScraper(headless=True)
-    
     try:
-        # Scrape all available data
-        print("Starting CFP rankings scrape...")
-        data = scraper.scrape_all_years()
-        
-        if data:
-            print(f"\nSuccessfully collected {len(data)} rankings!")
-            
-            # Export main file
-            main_csv = scraper.export_to_csv(data)
-            print(f"Main CSV: {main_csv}")
-            
-            # Export by year
-            year_files = scraper.export_by_year(data)
-            print(f"Year files: {len(year_files)} created")
-            
-            # Show summary
-            df = pd.DataFrame(data)
-            print(f"\nSummary:")
-            print(f"Years: {sorted(df['year'].unique())}")
-            print(f"Weeks per year: {df.groupby('year')['week'].nunique().to_dict()}")
-            print(f"Teams in rankings: {df['team'].nunique()}")
-            
-        else:
-            print("No data collected. Check logs for errors.")
+        checkpoint_file = os.path.join(EXPORT_DIR, "cfp_checkpoint.jsonl")
+        with CFPRankingsScraper(headless=True, checkpoint_file=checkpoint_file) as scraper:
+            # Scrape all available data
+            print("Starting CFP rankings scrape...")
+            data = scraper.scrape_all_years()
+            
+            if data:
+                print(f"\nSuccessfully collected {len(data)} rankings!")
+                
+                # Export main file
+                main_csv = scraper.export_to_csv(data)
+                print(f"Main CSV: {main_csv}")
+                
+                # Export by year
+                year_files = scraper.export_by_year(data)
+                print(f"Year files: {len(year_files)} created")
+                
+                # Show summary
+                df = pd.DataFrame(data, columns=RANKING_COLUMNS)
+                print(f"\nSummary:")
+                print(f"Years: {sorted(df['year'].unique())}")
+                print(f"Weeks per year: {df.groupby('year')['week'].nunique().to_dict()}")
+                print(f"Teams in rankings: {df['team'].nunique()}")
+                
+            else:
+                print("No data collected. Check logs for errors.")
             
     except Exception as e:
         print(f"Error: {e}")
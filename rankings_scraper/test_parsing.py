@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Offline checks of the rankings parser and checkpoint file (no browser or network).
+"""
+
+from bs4 import BeautifulSoup
+import lxml.html
+
+from cfp_scraper import CFPRankingsScraper
+
+RANKINGS_HTML = """
+<html><body>
+<table>
+  <tr><th>Rank</th><th>Team</th><th>Record</th></tr>
+  <tr><td>#1</td><td><img alt="Logo" src="ore.png"/><span>Logo</span>Oregon</td><td>13-0</td></tr>
+  <tr><td>2.</td><td>Georgia <span>Bulldogs</span></td><td>11-2</td></tr>
+  <tr><td>3</td><td>Penn State</td><td>FBS</td><td>11-2</td></tr>
+  <tr><td>26</td><td>Not Ranked</td><td>8-4</td></tr>
+  <tr><td>Others receiving votes</td><td>Army</td><td>11-1</td></tr>
+</table>
+</body></html>
+"""
+
+
+def test_parse_rankings():
+    """Header rows are skipped; #1/1. ranks, logo text and records are parsed."""
+    scraper = CFPRankingsScraper()
+    rankings = scraper._parse_rankings(RANKINGS_HTML, "2024", "Week 15")
+    
+    assert [row[:5] for row in rankings] == [
+        (2024, "Week 15", 1, "Oregon", "13-0"),
+        (2024, "Week 15", 2, "GeorgiaBulldogs", "11-2"),
+        (2024, "Week 15", 3, "Penn State", "11-2"),
+    ]
+    # Every row on a page shares one timestamp
+    assert len({row[5] for row in rankings}) == 1
+
+
+def test_parse_rankings_empty_page():
+    """A page without tables yields no rankings rather than an error."""
+    scraper = CFPRankingsScraper()
+    assert scraper._parse_rankings("", "2024", "Week 15") == []
+    assert scraper._parse_rankings("<html><body><p>No rankings</p></body></html>", "2024", "Week 15") == []
+
+
+def test_cell_text_matches_beautifulsoup():
+    """Cell text matches what get_text(strip=True) produced before the lxml rewrite."""
+    lxml_cells = lxml.html.fromstring(RANKINGS_HTML).xpath('//td|//th')
+    soup_cells = BeautifulSoup(RANKINGS_HTML, 'lxml').find_all(['td', 'th'])
+    
+    assert [CFPRankingsScraper._cell_text(cell) for cell in lxml_cells] == \
+        [cell.get_text(strip=True) for cell in soup_cells]
+
+
+def test_checkpoint_round_trip(tmp_path):
+    """Saved weeks load back as the same tuples; a truncated line is skipped."""
+    checkpoint_file = tmp_path / "cfp_checkpoint.jsonl"
+    scraper = CFPRankingsScraper(checkpoint_file=str(checkpoint_file))
+    
+    week_15 = [(2024, "Week 15", 1, "Oregon", "13-0", "2024-12-03T19:00:00"),
+               (2024, "Week 15", 2, "Georgia", "11-2", "2024-12-03T19:00:00")]
+    week_16 = [(2024, "Week 16", 1, "Oregon", "13-0", "2024-12-08T12:00:00")]
+    scraper._save_checkpoint("2024", "Week 15", week_15)
+    scraper._save_checkpoint("2024", "Week 16", week_16)
+    
+    # Simulate a crash mid-write
+    with open(checkpoint_file, 'a') as f:
+        f.write('{"year": 2024, "week": "Wee')
+    
+    # The resumed run's next week must not be glued onto the truncated line
+    week_17 = [(2024, "Week 17", 1, "Oregon", "13-0", "2024-12-15T12:00:00")]
+    scraper._save_checkpoint("2024", "Week 17", week_17)
+    
+    assert scraper._load_checkpoint() == {
+        ("2024", "Week 15"): week_15,
+        ("2024", "Week 16"): week_16,
+        ("2024", "Week 17"): week_17,
+    }
+
+
+def test_checkpoint_write_failure_is_not_fatal(tmp_path):
+    """A checkpoint that can't be written is logged, not raised."""
+    scraper = CFPRankingsScraper(checkpoint_file=str(tmp_path / "missing" / "cfp_checkpoint.jsonl"))
+    scraper._save_checkpoint("2024", "Week 15", [(2024, "Week 15", 1, "Oregon", "13-0", "")])
+
+
+def test_checkpoint_disabled_by_default():
+    """Without a checkpoint_file nothing is written or loaded."""
+    scraper = CFPRankingsScraper()
+    scraper._save_checkpoint("2024", "Week 15", [(2024, "Week 15", 1, "Oregon", "13-0", "")])
+    assert scraper._load_checkpoint() == {}
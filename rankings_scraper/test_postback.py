@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Offline checks of the HTTP postback path against a fake session (no network).
+"""
+
+import lxml.html
+import requests
+
+from cfp_scraper import CFPRankingsScraper
+
+YEARS = ["2024", "2023"]
+WEEKS = ["Week 10", "Week 11"]
+
+
+def rankings_page(year: str, week: str) -> bytes:
+    """A rankings page with the given year and week selected."""
+    year_options = ''.join(
+        f'<option value="{y}"{" selected" if y == year else ""}>{y}</option>' for y in YEARS)
+    week_options = ''.join(
+        f'<option value="{w}"{" selected" if w == week else ""}>{w}</option>' for w in WEEKS)
+    return f"""
+<html><body>
+<form method="post" action="./rankings.aspx?view=poll">
+  <input type="hidden" name="__VIEWSTATE" value="state-{year}-{week}"/>
+  <input type="hidden" name="__EVENTVALIDATION" value="valid"/>
+  <input type="text" name="search" value="ignored"/>
+  <select name="ctl00$year">{year_options}</select>
+  <select name="ctl00$week"><option value=""></option>{week_options}</select>
+</form>
+<table>
+  <tr><td>1</td><td>Team {year} {week}</td><td>10-0</td></tr>
+</table>
+</body></html>
+""".encode()
+
+
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.url = "https://collegefootballplayoff.com/rankings.aspx"
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves the 2024/Week 11 page, and if honour_postbacks the posted selection."""
+
+    def __init__(self, honour_postbacks: bool = True, reachable: bool = True):
+        self.honour_postbacks = honour_postbacks
+        self.reachable = reachable
+        self.posts = []
+
+    def get(self, url, timeout):
+        if not self.reachable:
+            raise requests.ConnectionError("connection refused")
+        return FakeResponse(rankings_page("2024", "Week 11"))
+
+    def post(self, url, data, timeout):
+        self.posts.append((url, data))
+        if self.honour_postbacks:
+            return FakeResponse(rankings_page(data["ctl00$year"], data["ctl00$week"]))
+        return FakeResponse(rankings_page("2024", "Week 11"))
+
+    def close(self):
+        pass
+
+
+def make_scraper(session: FakeSession) -> CFPRankingsScraper:
+    scraper = CFPRankingsScraper()
+    scraper.session = session
+    scraper._http_ready = scraper._open_session()
+    return scraper
+
+
+def test_load_form_state():
+    """Hidden inputs, named dropdowns and the form action are harvested."""
+    scraper = CFPRankingsScraper()
+    page = lxml.html.fromstring(rankings_page("2023", "Week 10"))
+    
+    assert scraper._load_form_state(page, "https://collegefootballplayoff.com/rankings.aspx")
+    assert scraper._state.form_action == "https://collegefootballplayoff.com/rankings.aspx?view=poll"
+    assert scraper._state.form_fields == {"__VIEWSTATE": "state-2023-Week 10", "__EVENTVALIDATION": "valid"}
+    assert scraper._state.form_selects == [
+        ("ctl00$year", {"2024": "2024", "2023": "2023"}, "2023"),
+        ("ctl00$week", {"Week 10": "Week 10", "Week 11": "Week 11"}, "Week 10"),
+    ]
+
+
+def test_load_form_state_without_postback_form():
+    """A page without __VIEWSTATE can't be driven over HTTP."""
+    scraper = CFPRankingsScraper()
+    page = lxml.html.fromstring("<html><body><select name='a'></select></body></html>")
+    
+    assert not scraper._load_form_state(page, "https://collegefootballplayoff.com/rankings.aspx")
+
+
+def test_postback_honoured():
+    """An applied postback returns the new page and keeps the HTTP path."""
+    session = FakeSession()
+    scraper = make_scraper(session)
+    
+    assert scraper._select_year_http("2023") == WEEKS
+    page = scraper._postback(1, "Week 10")
+    
+    assert page is not None
+    assert scraper._http_ready
+    assert scraper._state.form_fields["__VIEWSTATE"] == "state-2023-Week 10"
+    url, data = session.posts[-1]
+    assert url == "https://collegefootballplayoff.com/rankings.aspx?view=poll"
+    assert data["__EVENTTARGET"] == "ctl00$week"
+    assert data["__VIEWSTATE"] == "state-2023-Week 11"
+    assert [row[3] for row in scraper._parse_rankings(page, "2023", "Week 10")] == ["Team 2023 Week 10"]
+
+
+def test_postback_ignored_falls_back_to_browser():
+    """A response still showing the old selection is never returned as the new one."""
+    scraper = make_scraper(FakeSession(honour_postbacks=False))
+    
+    assert scraper._select_year_http("2023") == []
+    assert scraper._http_ready is False
+
+
+def test_open_session_failure_falls_back_to_browser():
+    """A year whose page can't be loaded over HTTP switches the scraper to the browser."""
+    session = FakeSession()
+    scraper = make_scraper(session)
+    session.reachable = False
+    
+    assert scraper._select_year_http("2023") == []
+    assert scraper._http_ready is False
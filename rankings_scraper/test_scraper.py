@@ -3,7 +3,7 @@
 Test the CFP scraper with a single year to verify it works correctly.
 """
 
-from cfp_scraper import CFPRankingsScraper
+from cfp_scraper import CFPRankingsScraper, RANKING_COLUMNS
 import pandas as pd
 
 def test_single_year():
@@ -19,11 +19,11 @@ def test_single_year():
             
             # Show sample data
             print("\nSample rankings:")
-            for i, entry in enumerate(data_2022[:10]):
-                print(f"{entry['week']} - #{entry['rank']} {entry['team']} ({entry['record']})")
+            for year, week, rank, team, record, scraped_at in data_2022[:10]:
+                print(f"{week} - #{rank} {team} ({record})")
             
             # Export to test CSV
-            df = pd.DataFrame(data_2022)
+            df = pd.DataFrame(data_2022, columns=RANKING_COLUMNS)
             csv_file = "/Users/mainamusa/Documents/Personal/CFB Data/cfp-ranking-predictor/test_2022_rankings.csv"
             df.to_csv(csv_file, index=False)
             print(f"\nTest data saved to: {csv_file}")
@@ -41,8 +41,7 @@ def test_single_year():
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        if scraper.driver:
-            scraper.driver.quit()
+        scraper.close()
 
 if __name__ == "__main__":
     test_single_year()